@@ -1,37 +1,53 @@
 import logging
-import pandas as pd 
+import pandas as pd
 from src.modules.paths import RAW_FILE_PATH
+from src.modules.constants import CHUNK_SIZE
 from src.extract.extract import extract_data
 from src.log.log_config import setup_logging
+from src.modules.config import setup_pandas
 from src.transform.transform import transform_data
 
 setup_logging()
+setup_pandas()
 
 def main():
 
-    logging.info(f'[Pipeline] Starting ETL process...')
+    logging.info('[Pipeline] Starting ETL process...')
     logging.info('='* 50)
 
-    # === STEP 1: EXTRACT ===
-    logging.info(f'[Pipeline] Extracting data...')
+    # === STEP 1: EXTRACT (STREAMED IN CHUNKS) ===
+    logging.info('[Pipeline] Extracting data...')
 
-    df_raw, extract_stats = extract_data(RAW_FILE_PATH)
-    
-    if df_raw.empty:
-        logging.warning(f'[Pipeline] The extracted data is empty. Check the source file.')
+    df_raw, extract_stats = extract_data(RAW_FILE_PATH, chunksize=CHUNK_SIZE)
+
+    if df_raw is None:
+        logging.warning('[Pipeline] No data could be extracted. Check the source file.')
         return
-    
-    logging.info(f'[Pipeline] Data extraction complete!')
-    logging.info(f'[Pipeline] First 5 rows of the extracted data:')
-    logging.info(f'\n' + df_raw.head().to_string(index=False))
-    logging.info('='* 50)
 
-    # === STEP 3: TRANSFORM 
+    logging.info('[Pipeline] Data extraction complete!')
+
+    # === STEP 2: TRANSFORM EACH CHUNK ===
     logging.info('[Pipeline] Initiating data transformation process...')
-    df_final = transform_data(df_raw)
+
+    transformed_chunks = []
+    for df_chunk in df_raw:
+
+        # Log a preview of the first chunk only; the to_string() rendering is
+        # guarded so it is skipped entirely when INFO is filtered out.
+        if not transformed_chunks and logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info('[Pipeline] First 5 rows of the extracted data:')
+            logging.info('\n%s', df_chunk.head().to_string(index=False))
+            logging.info('='* 50)
+
+        transformed_chunks.append(transform_data(df_chunk))
+
+    if not transformed_chunks:
+        logging.warning('[Pipeline] The extracted data is empty. Check the source file.')
+        return
+
+    df_final = pd.concat(transformed_chunks, ignore_index=True)
     logging.info('[Pipeline] Data transformation successfully completed.')
     logging.info('='* 50)
 
 if __name__ == '__main__':
     main()
-
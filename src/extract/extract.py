@@ -1,37 +1,167 @@
+import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import logging
+from src.modules.constants import STRING_COLS
+from src.modules.paths import parquet_twin
+from src.modules.stats import ExtractStats
 
 
-def extract_data(file_path):
+def _csv_convert_options(file_path):
+    """
+    Build Arrow ConvertOptions mapping the raw CSV header onto the expected schema.
+
+    Only string columns are typed: forcing NUMERIC_COLS to float64 at read time
+    would make the reader raise on invalid markers ('error', 'unknown', ...)
+    that the transform pipeline is built to coerce to NaN downstream.
+    """
+    # Read only the header line to discover the raw column names.
+    with open(file_path, 'r', encoding='utf-8') as f:
+        raw_header = f.readline().strip().split(',')
+
+    # Match each raw column against the known schema after normalization.
+    column_types = {}
+    for raw_col in raw_header:
+        normalized = raw_col.strip().title().replace(' ', '_')
+        if normalized in STRING_COLS:
+            column_types[raw_col] = pa.string()
+
+    return pv.ConvertOptions(column_types=column_types)
+
+
+def _csv_dtype_hints(file_path):
+    """
+    Build a pandas dtype mapping for the raw CSV header, mirroring _csv_convert_options.
+
+    As with the Arrow reader, numeric columns are left untyped: a float64 hint
+    would make the reader raise mid-iteration on invalid markers that
+    convert_data_types coerces to NaN downstream.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        raw_header = f.readline().strip().split(',')
+
+    dtype_hints = {}
+    for raw_col in raw_header:
+        normalized = raw_col.strip().title().replace(' ', '_')
+        if normalized in STRING_COLS:
+            dtype_hints[raw_col] = 'string'
+
+    return dtype_hints
+
+
+def _iter_parquet_chunks(parquet_path, chunksize):
+    """
+    Yield DataFrame chunks from the Parquet cache, chunksize rows at a time.
+    """
+    parquet_file = pq.ParquetFile(parquet_path, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        yield pa.Table.from_batches([batch]).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _iter_csv_chunks(file_path, parquet_path, chunksize, dtype_hints):
+    """
+    Yield DataFrame chunks from the CSV while building the Parquet cache.
+
+    The cache is written incrementally to a temp file and only moved into
+    place once the whole CSV has streamed through, so an interrupted or
+    partially consumed run never leaves a truncated cache behind. If chunk
+    schemas drift (e.g. a stray token flips a numeric column to strings in
+    one chunk), caching is abandoned but streaming continues.
+    """
+    tmp_path = str(parquet_path) + '.tmp'
+    writer = None
+    caching = True
+    completed = False
+
+    try:
+        for chunk in pd.read_csv(file_path, chunksize=chunksize, dtype=dtype_hints):
+            if caching:
+                try:
+                    tbl_chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = pq.ParquetWriter(tmp_path, tbl_chunk.schema)
+                    writer.write_table(tbl_chunk)
+                except (pa.ArrowInvalid, ValueError) as exc:
+                    logging.warning('[Extract] Skipping Parquet caching (inconsistent chunk schemas): %s', exc)
+                    caching = False
+            yield chunk
+        completed = True
+    finally:
+        if writer is not None:
+            writer.close()
+        if completed and caching and writer is not None:
+            os.replace(tmp_path, parquet_path)
+            logging.info('[Extract] Cached Parquet copy at %s for faster re-reads', parquet_path)
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def extract_data(file_path, chunksize=None):
     """
     EXTRACT DATA FROM CSV AND LOG DETAILED INFO
+
+    When chunksize is set, return an iterator of DataFrame chunks instead of the
+    full frame, keeping peak memory at O(chunk) rather than O(file). Both paths
+    prefer the Parquet twin of the file when it exists and create it otherwise.
     """
-    # === STEP 1: READ CSV ===
-    logging.debug(f'[Extract] Attempting to read CSV file from {file_path}')
-    
+    # === STEP 0: STREAMING PATH (CHUNKED READ, O(chunk) MEMORY) ===
+    if chunksize is not None:
+        parquet_path = parquet_twin(file_path)
+
+        if os.path.exists(parquet_path):
+            logging.info('[Extract] Streaming cached Parquet copy from %s (%s rows per chunk)', parquet_path, chunksize)
+            return _iter_parquet_chunks(parquet_path, chunksize), None
+
+        logging.debug('[Extract] Opening CSV file from %s in chunks of %s rows', file_path, chunksize)
+
+        try:
+            dtype_hints = _csv_dtype_hints(file_path)
+
+        except FileNotFoundError:
+
+            logging.error('[Extract] FAILED: File not found at path: %s', file_path)
+            return None, None
+
+        logging.info('[Extract] Streaming data from %s (%s rows per chunk)', file_path, chunksize)
+        return _iter_csv_chunks(file_path, parquet_path, chunksize, dtype_hints), None
+
+    # === STEP 1: READ DATA (PARQUET CACHE IF PRESENT, ELSE MULTI-THREADED ARROW CSV READER) ===
+    logging.debug('[Extract] Attempting to read data file from %s', file_path)
+
     try:
-        df_raw = pd.read_csv(file_path)
-
-    # === STEP 2: DATA QUALITY STATS ===
-    
-        total_rows = df_raw.shape[0]
-        total_columns = df_raw.shape[1]
-        dtype_info = df_raw.dtypes.to_dict()
-        missing_values = df_raw.isna().sum().sum()
-
-        stats = {
-            'rows': total_rows, 
-            'columns': total_columns, 
-            'missing values': missing_values, 
-            'dtype': dtype_info
-        }
+        # Prefer the memory-mapped Parquet twin of the CSV: binary columnar
+        # decode is far faster than CSV tokenization and preserves dtypes.
+        parquet_path = parquet_twin(file_path)
+
+        if os.path.exists(parquet_path):
+            logging.info('[Extract] Reading cached Parquet copy from %s', parquet_path)
+            tbl = pq.read_table(parquet_path, memory_map=True)
+        else:
+            tbl = pv.read_csv(file_path, convert_options=_csv_convert_options(file_path))
+            pq.write_table(tbl, parquet_path)
+            logging.info('[Extract] Cached Parquet copy at %s for faster re-reads', parquet_path)
+
+        df_raw = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+
+    # === STEP 2: DATA QUALITY STATS (FROM ARROW METADATA, NO EXTRA PANDAS PASS) ===
+
+        stats = ExtractStats(
+            rows=tbl.num_rows,
+            columns=tbl.num_columns,
+            missing_values=sum(col.null_count for col in tbl.columns),
+            _dtypes=df_raw.dtypes
+        )
 
     # === STEP 3 : LOG STATS ===
-        logging.info(f'[Extract] Data successfully extracted from {file_path}')
-        logging.info(f'[Extract] Rows: {total_rows}, Columns: {total_columns}, Missing Values: {missing_values}')
-        logging.debug(f'[Extract] Column Types: {dtype_info}')
+        logging.info('[Extract] Data successfully extracted from %s', file_path)
+        logging.info('[Extract] Rows: %s, Columns: %s, Missing Values: %s', stats.rows, stats.columns, stats.missing_values)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('[Extract] Column Types: %s', stats.dtype)
         return df_raw, stats
-    
+
     except FileNotFoundError:
-    
-        logging.error(f'[Extract] FAILED: File not found at path: {file_path}')
+
+        logging.error('[Extract] FAILED: File not found at path: %s', file_path)
+        return None, None
@@ -1,21 +1,37 @@
-import logging 
-import os 
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
 
-def setup_logging(log_file: str = 'project.log'):
+def setup_logging(log_file: str = 'project.log', level: int = logging.INFO):
     # CREATE LOGS DIRECTORY IF IT DOESN'T EXIST
     os.makedirs('logs', exist_ok=True)
     log_path = os.path.join('logs', log_file)
 
-    # BASIC CONFIGURATION
-    logging.basicConfig( 
-        level=logging.DEBUG, 
-        format='%(asctime)s - %(levelname)s - %(message)s', 
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.FileHandler(log_path),   # SAVE LOG TO FILE
-            logging.StreamHandler()          # SHOW OUTPUT ON CONSOLE
-        ]
+    # HANDLERS THAT DO THE ACTUAL (BLOCKING) I/O
+    formatter = logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(message)s',
+        datefmt="%Y-%m-%d %H:%M:%S"
     )
+    file_handler = logging.FileHandler(log_path)     # SAVE LOG TO FILE
+    stream_handler = logging.StreamHandler()         # SHOW OUTPUT ON CONSOLE
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
 
-    logging.info('Logging initialized successfully!')
+    # ASYNC PIPELINE: LOGGER -> QUEUE -> LISTENER THREAD -> HANDLERS
+    # The hot path only enqueues records; disk/terminal writes happen on the
+    # listener thread, so logger calls never block on I/O.
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers.clear()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
+    logging.info('Logging initialized successfully!')
@@ -0,0 +1,9 @@
+import pandas as pd
+
+def setup_pandas():
+    """
+    Enable copy-on-write so the transform functions stay pure without paying
+    for full defensive copies. CoW is always on from pandas 3.0 onwards.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.options.mode.copy_on_write = True
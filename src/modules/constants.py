@@ -1,3 +1,6 @@
+# Number of rows per chunk when streaming the raw CSV through the pipeline.
+CHUNK_SIZE = 5000
+
 EXPECTED_COLS = [
     'Transaction_Id',
     'Customer_Id',
@@ -12,6 +15,9 @@ EXPECTED_COLS = [
     'Discount_Applied'
 ]
 
+# Frozen set view of the expected schema for O(1) membership tests.
+EXPECTED_COLS_SET = frozenset(EXPECTED_COLS)
+
 # Define explicitly the columns that are expected to be strings/categorical data.
 STRING_COLS = [
     'Transaction_Id', 
@@ -22,7 +28,18 @@ STRING_COLS = [
     'Location'
 ]
 
-# Define explicitly the columns that are expected to be numeric data. 
+# Common string representations of missing/invalid data.
+INVALID_VALUES = ['error', 'unknown', 'nan', 'none', 'na', '']
+
+# Low-cardinality string columns worth encoding as pandas Categoricals.
+CATEGORICAL_COLS = [
+    'Category',
+    'Item',
+    'Payment_Method',
+    'Location'
+]
+
+# Define explicitly the columns that are expected to be numeric data.
 NUMERIC_COLS = [
     'Price_Per_Unit', 
     'Quantity', 
@@ -1,18 +1,26 @@
-import os
-import pandas as pd 
+from pathlib import Path
 
 # PATH OF THE BASE DIRECTORY
-BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+BASE_PATH = Path(__file__).resolve().parents[2]
 
 # PATH OF THE DATA FOLDER
-DATA_PATH = os.path.join(BASE_PATH, 'data')
+DATA_PATH = BASE_PATH / 'data'
 
 # SUBFOLDERS PATHS
-DIRS = {name: os.path.join(DATA_PATH, name) for name in ['raw', 'processed','backup']}
+DIRS = {name: DATA_PATH / name for name in ['raw', 'processed', 'backup']}
 RAW_DIRS = DIRS['raw']
 PROCESSED_DIRS = DIRS['processed']
 BACKUP_DIRS = DIRS['backup']
 
 # MAIN FILE NAME AND PATH
 RAW_FILE_NAME = 'retail_store.csv'
-RAW_FILE_PATH = os.path.join(RAW_DIRS, RAW_FILE_NAME)
+RAW_FILE_PATH = RAW_DIRS / RAW_FILE_NAME
+
+# PARQUET CACHE OF THE RAW FILE (BINARY, COLUMNAR, MUCH FASTER TO RE-READ)
+def parquet_twin(file_path):
+    """
+    Return the path of the Parquet cache twin for a raw data file.
+    """
+    return Path(file_path).with_suffix('.parquet')
+
+PARQUET_FILE_PATH = parquet_twin(RAW_FILE_PATH)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+import pandas as pd
+
+# Note: slots=True is not used because cached_property needs an instance
+# __dict__ to store its result.
+
+@dataclass
+class ExtractStats:
+    """
+    Data quality statistics collected during extraction.
+
+    The dtype rendering is deferred: the string conversion only runs if a
+    consumer (usually a DEBUG log) actually reads the property.
+    """
+    rows: int
+    columns: int
+    missing_values: int
+    _dtypes: pd.Series = field(repr=False)
+
+    @cached_property
+    def dtype(self) -> dict:
+        return {col: str(dtype) for col, dtype in self._dtypes.items()}
+
+@dataclass
+class OverviewStats:
+    """
+    Data quality statistics collected by the transform overview step.
+    """
+    row_count: int
+    missing_values: dict
+    _dtypes: pd.Series = field(repr=False)
+
+    @cached_property
+    def data_type(self) -> dict:
+        return {col: str(dtype) for col, dtype in self._dtypes.items()}
@@ -1,101 +1,164 @@
+import functools
 import logging
 import numpy as np
-import pandas as pd 
-from src.modules.constants import EXPECTED_COLS, STRING_COLS, NUMERIC_COLS
+import pandas as pd
+from src.modules.constants import EXPECTED_COLS, EXPECTED_COLS_SET, STRING_COLS, NUMERIC_COLS, CATEGORICAL_COLS, INVALID_VALUES
+from src.modules.stats import OverviewStats
+
+__all__ = ['transform_data']
+
+def _is_string_dtype(dtype) -> bool:
+    """
+    True only for dedicated string dtypes (StringDtype / Arrow strings).
+
+    pd.api.types.is_string_dtype also accepts plain object dtype, but object
+    columns can hold non-string scalars that .str ops would silently turn
+    into NaN, so those still need the astype(str) cast.
+    """
+    return pd.api.types.is_string_dtype(dtype) and dtype != object
+
+@functools.lru_cache(maxsize=8)
+def _normalize_columns(raw_columns: tuple) -> tuple:
+    """
+    Normalize a raw column-name tuple and compare it against the expected schema.
+
+    Cached so chunks sharing the same CSV header pay for the string cleanup and
+    schema comparison only once.
+    """
+    # Apply the cleaning pipeline in a single pass per name: strip external spaces,
+    # Capitalize, and replace internal spaces with '_'.
+    renamed = tuple(col.strip().title().replace(' ', '_') for col in raw_columns)
+
+    # Check for discrepancies by comparing the result against the expected schema.
+    renamed_set = set(renamed)
+    missing = tuple(col for col in EXPECTED_COLS if col not in renamed_set)
+    extra = tuple(col for col in renamed if col not in EXPECTED_COLS_SET)
+
+    return renamed, missing, extra
 
 def rename_columns(df):
     """
     Standardize column names and perform schema validation.
     """
 
-    # Create a copy to ensure the function is pure.
-    df = df.copy()
-
-    # Apply the cleaning pipeline: strip external spaces, Capitalize, and replace internal spaces with '_'.
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.title()
-        .str.replace(' ', '_', regex=False)
-    )
+    # Normalization and validation are memoized on the raw header, so repeated
+    # chunks reduce to a single cache lookup.
+    renamed, missing_columns, extra_columns = _normalize_columns(tuple(df.columns))
 
-    # Check for discrepancies by comparing current columns against the expected schema. 
-    missing_columns = [col for col in EXPECTED_COLS if col not in df.columns]
-    extra_columns = [col for col in df.columns if col not in EXPECTED_COLS]
+    # set_axis() returns a new frame without copying the data blocks under copy-on-write.
+    df = df.set_axis(renamed, axis=1)
 
     if missing_columns:
-        logging.error(f'[Transform][rename_columns] Missing columns: {missing_columns}')
-        raise ValueError(f'[Transform][rename_columns] The dataframe schema is invalid. The following columns are missing: {missing_columns}')
-    
-    if extra_columns: 
-        logging.info(f'[Transform][rename_columns] Extra columns found: {extra_columns}. Returning only expected columns')
+        logging.error('[Transform][rename_columns] Missing columns: %s', list(missing_columns))
+        raise ValueError(f'[Transform][rename_columns] The dataframe schema is invalid. The following columns are missing: {list(missing_columns)}')
+
+    if extra_columns:
+        logging.info('[Transform][rename_columns] Extra columns found: %s. Returning only expected columns', list(extra_columns))
 
     # Debug log of final columns 
-    logging.debug(f'[Transform][rename_columns] Columns after renaming: {list(df.columns)}')
+    logging.debug('[Transform][rename_columns] Columns after renaming: %s', list(df.columns))
 
     return df[EXPECTED_COLS]
 
-def data_overview(df: pd.DataFrame, stage: str = "INITIAL", invalid_values: list = None) -> dict:
+def data_overview(df: pd.DataFrame, stage: str = "INITIAL", invalid_values: list = None) -> OverviewStats:
     """
     Logs missing values and basic data quality statistics before and after core transformation steps.
     """
-    # Create a copy to ensure the function is pure.
-    df = df.copy()
+    # Shallow copy: copy-on-write only duplicates the columns this function touches.
+    df = df.copy(deep=False)
 
     # Define common string representations of missing/invalid data to be standardized.
     if invalid_values is None:
-        invalid_values = ['error', 'unknown', 'nan', 'none', 'na', '']
+        invalid_values = INVALID_VALUES
+
+    # Hash the invalid values once so each column needs a single isin() pass.
+    invalid_set = frozenset(invalid_values)
+
+    # Null counts are collected while cleaning so no column is scanned twice:
+    # the mask used for nulling invalid values doubles as the null mask.
+    missing_counts = {}
 
     # Standardize string columns: convert common invalid values to np.nan for accurate counting.
     for col in STRING_COLS:
         if col in df.columns:
-            df[col] = (
-            df[col]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-            .replace(invalid_values, np.nan)
-        )
-    # Standardize numeric columns: convert invalid strings to np.nan for accurate counting. 
-    for col in NUMERIC_COLS:  
+            s = df[col]
+
+            # Categorical fast path: clean the (tiny) categories list instead of
+            # every row, which is O(unique) rather than O(N).
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                cleaned = s.cat.categories.astype(str).str.strip().str.lower()
+                if not cleaned.has_duplicates:
+                    s = s.cat.rename_categories(cleaned)
+                    invalid_cats = [c for c in s.cat.categories if c in invalid_set]
+                    if invalid_cats:
+                        s = s.cat.remove_categories(invalid_cats)
+                    df[col] = s
+                    missing_counts[col] = int(s.isna().sum())
+                    continue
+
+            # Only pay for the str cast when the column is not already strings.
+            if not _is_string_dtype(s.dtype):
+                s = s.astype(str)
+            s = s.str.strip().str.lower()
+            mask = s.isin(invalid_set) | s.isna()
+            df[col] = s.mask(mask, np.nan)
+            missing_counts[col] = int(mask.sum())
+
+    # Standardize numeric columns: convert invalid strings to np.nan for accurate counting.
+    for col in NUMERIC_COLS:
         if col in df.columns:
-            df[col] = (
-            df[col]
-            .astype(str)
-            .str.strip()
-            .replace(invalid_values, np.nan)
-        )
-            
+            s = df[col]
+
+            # Already-numeric columns cannot hold string markers: counting
+            # nulls is enough, no str round-trip needed.
+            if pd.api.types.is_numeric_dtype(s):
+                missing_counts[col] = int(s.isna().sum())
+                continue
+
+            if not _is_string_dtype(s.dtype):
+                s = s.astype(str)
+            s = s.str.strip()
+            mask = s.isin(invalid_set) | s.isna()
+            df[col] = s.mask(mask, np.nan)
+            missing_counts[col] = int(mask.sum())
+
     # Compute missing value summary across all columns after preliminary cleaning.
-    missing_summary = df.isna().sum()
+    # Untouched columns get a single column-wise reduction; cleaned columns
+    # reuse the masks computed above.
+    missing_summary = pd.Series({
+        col: missing_counts[col] if col in missing_counts else int(df[col].isna().sum())
+        for col in df.columns
+    })
     
     # Log the results, including the current stage (INITIAL or FINAL) for traceability.
-    logging.info(f'[Transform][data_overview][{stage}] Missing values per column:\n{missing_summary}')
-
-    # Assemble a dictionary with key data quality statistics for potential return or storage.
-    stats = {
-        'row_count': len(df), 
-        'missing_values': missing_summary.to_dict(), 
-        'data_type': df.dtypes.apply(str).to_dict()
-    }
+    logging.info('[Transform][data_overview][%s] Missing values per column:\n%s', stage, missing_summary)
+
+    # Assemble key data quality statistics for potential return or storage;
+    # the dtype rendering is deferred until something reads stats.data_type.
+    stats = OverviewStats(
+        row_count=len(df),
+        missing_values=missing_summary.to_dict(),
+        _dtypes=df.dtypes
+    )
 
     return stats
 
 def convert_data_types(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Convert columns to their correct data type. 
+    Convert columns to their correct data type.
     """
-    # Create a copy to ensure the function is pure.
-    df = df.copy()
+    # Shallow copy: copy-on-write only duplicates the columns this function touches.
+    df = df.copy(deep=False)
 
     # Standardize string columns by replacing empty spaces with underscores.
+    # Categorical columns are left as-is: casting them back to str would
+    # re-materialize the full object array and lose the dictionary encoding.
     for col in STRING_COLS:
-        if col in df.columns:
-            df[col] = (
-            df[col]
-            .astype(str)
-            .replace(' ', '_')
-        )
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            s = df[col]
+            if not _is_string_dtype(s.dtype):
+                s = s.astype(str)
+            df[col] = s.replace(' ', '_')
             
     # Convert cleaned numeric columns to float64 to turn any remaining invalid values into NaN.
     for col in NUMERIC_COLS:
@@ -103,46 +166,34 @@ def convert_data_types(df: pd.DataFrame) -> pd.DataFrame:
             df[col] = pd.to_numeric(df[col], errors='coerce')
 
     # Convert the transaction date column to the datetime dtype, coercing any invalid dates to NaT (Not a Time).
+    # The explicit format dispatches to the vectorized strptime path instead of
+    # per-row inference, and cache=True dedupes repeated date strings.
     if 'Transaction_Date' in df.columns:
-        df['Transaction_Date'] = pd.to_datetime(df['Transaction_Date'], errors='coerce')
+        df['Transaction_Date'] = pd.to_datetime(
+            df['Transaction_Date'], format='%Y-%m-%d', errors='coerce', cache=True
+        )
 
     return df
 
 def clean_price_per_unit(df: pd.DataFrame) -> pd.DataFrame:
 
-    # Create a copy to ensure the function is pure.
-    df = df.copy()
+    # Shallow copy: copy-on-write only duplicates the columns this function touches.
+    df = df.copy(deep=False)
 
     # Log the count of NaNs before imputation for quality check.
     count_before_na = df['Price_Per_Unit'].isna().sum()
 
-    # 1. Extract the Item ID (number) from the 'Item' column.
-    df['Item_Number'] = (
-        df['Item']
-        .str.split('_').str[1]
-        .astype(str)
-    )
-    # 2. Create the mapping dictonary (item_id -> Price)
-    price_map = (
-        df
-        .dropna(subset=['Item_Number', 'Price_Per_Unit'])
-        .set_index('Item_Number')
-        ['Price_Per_Unit'].to_dict()
-    )
-    # 3. Imputing missing Price_Per_Unit based on Item_Number mapping. 
-    df['Price_Per_Unit'] = np.where(
-        df['Price_Per_Unit'].isna() & df['Item_Number'].notna(), 
-        df['Item_Number'].map(price_map), 
-        df['Price_Per_Unit']
+    # Impute missing Price_Per_Unit from the first known price of the same Item.
+    # The Cython groupby path replaces the old split -> dict -> map chain,
+    # which forced every value through a Python hash lookup.
+    df['Price_Per_Unit'] = df['Price_Per_Unit'].fillna(
+        df.groupby('Item', sort=False)['Price_Per_Unit'].transform('first')
     )
 
     # Log the count of NaNs after imputation for quality check.
     count_after_na = df['Price_Per_Unit'].isna().sum()
     imputed_count = count_before_na - count_after_na
-    logging.info(f'[Transform][clean_price_per_unit] Imputed {imputed_count} values using item mapping. {count_after_na} NaNs remain.')
-
-    # Drop the temporaty column.
-    df.drop(columns=['Item_Number'], inplace=True)
+    logging.info('[Transform][clean_price_per_unit] Imputed %s values using item mapping. %s NaNs remain.', imputed_count, count_after_na)
 
     return df
 
@@ -150,13 +201,17 @@ def transform_data(df):
     """
     Main transformation pipeline. 
     """
-    # === STEP 0: CREATE A COPY OF THE DATAFRAME ===
-    df_clean = df.copy()
+    # === STEP 1: RENAMING & VALIDATE SCHEMA ===
+    logging.info('[Transform][rename_columns] Starting columns standardization and schema validation.')
+    df_clean = rename_columns(df)
+    logging.info('='* 50)
 
-    # === STEP 1: RENAMING & VALIDATE SCHEMA === 
-    logging.info(f'[Transform][rename_columns] Starting columns standardization and schema validation.')
-    df_clean = rename_columns(df_clean)
-    logging.info('='* 50) 
+    # === STEP 1B: CATEGORICAL ENCODING ===
+    # Encode low-cardinality string columns as Categoricals so later string
+    # ops and groupbys work on the small dictionary plus integer codes.
+    for col in CATEGORICAL_COLS:
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].astype('category')
 
     # === STEP 2: LOG DATA QUALITY (INITIAL) ===
     logging.info('[Transform][data_overview] Logging initial data statistics.')
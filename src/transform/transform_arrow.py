@@ -0,0 +1,77 @@
+import logging
+import pyarrow as pa
+import pyarrow.compute as pc
+from src.modules.constants import EXPECTED_COLS, STRING_COLS, NUMERIC_COLS, INVALID_VALUES
+from src.transform.transform import _normalize_columns
+
+def transform_table(tbl: pa.Table) -> pa.Table:
+    """
+    Arrow-native version of the transform pipeline.
+
+    Runs rename -> clean -> convert -> impute as pyarrow.compute kernels over a
+    single Table, one pass per column instead of one pass per pandas step.
+    Invalid string markers ('error', 'unknown', ...) are nulled in the output.
+    Callers that need pandas should finish with
+    tbl.to_pandas(self_destruct=True, split_blocks=True).
+    """
+    # === STEP 1: RENAMING & VALIDATE SCHEMA ===
+    renamed, missing_columns, extra_columns = _normalize_columns(tuple(tbl.column_names))
+
+    if missing_columns:
+        logging.error('[Transform][transform_table] Missing columns: %s', list(missing_columns))
+        raise ValueError(f'[Transform][transform_table] The table schema is invalid. The following columns are missing: {list(missing_columns)}')
+
+    if extra_columns:
+        logging.info('[Transform][transform_table] Extra columns found: %s. Returning only expected columns', list(extra_columns))
+
+    tbl = tbl.rename_columns(list(renamed)).select(EXPECTED_COLS)
+
+    # === STEP 2: CLEAN STRING COLUMNS (ONE SIMD KERNEL CHAIN PER COLUMN) ===
+    invalid_set = pa.array(INVALID_VALUES, type=pa.string())
+
+    for col in STRING_COLS:
+        idx = tbl.schema.get_field_index(col)
+        arr = pc.utf8_trim_whitespace(pc.cast(tbl.column(idx), pa.string()))
+        is_invalid = pc.is_in(pc.utf8_lower(arr), value_set=invalid_set)
+        tbl = tbl.set_column(idx, col, pc.if_else(is_invalid, None, arr))
+
+    # === STEP 3: DATA QUALITY (NULL COUNTS ARE ARRAY METADATA, NO DATA SCAN) ===
+    logging.info(
+        '[Transform][transform_table] Missing values per column: %s',
+        {name: tbl.column(name).null_count for name in tbl.column_names}
+    )
+
+    # === STEP 4: DATA TYPE CONVERSION ===
+    for col in NUMERIC_COLS:
+        idx = tbl.schema.get_field_index(col)
+        if not pa.types.is_floating(tbl.field(idx).type):
+            tbl = tbl.set_column(idx, col, pc.cast(tbl.column(idx), pa.float64()))
+
+    idx = tbl.schema.get_field_index('Transaction_Date')
+    date_col = tbl.column(idx)
+    if not (pa.types.is_timestamp(date_col.type) or pa.types.is_date(date_col.type)):
+        parsed = pc.strptime(pc.cast(date_col, pa.string()), format='%Y-%m-%d', unit='s', error_is_null=True)
+        tbl = tbl.set_column(idx, 'Transaction_Date', parsed)
+
+    # === STEP 5: IMPUTE PRICE PER UNIT ===
+    # First known price per Item, gathered back in row order via index_in/take
+    # (a Table.join would not preserve row order).
+    idx = tbl.schema.get_field_index('Price_Per_Unit')
+    price = tbl.column(idx)
+    count_before_na = price.null_count
+
+    # Rows without an Item must not contribute to (or receive from) the map.
+    known_items = tbl.select(['Item', 'Price_Per_Unit']).filter(pc.is_valid(tbl.column('Item')))
+    first_prices = known_items.group_by('Item').aggregate([('Price_Per_Unit', 'first')])
+    positions = pc.index_in(tbl.column('Item'), value_set=first_prices.column('Item').combine_chunks())
+    fill = pc.take(first_prices.column('Price_Per_Unit_first').combine_chunks(), positions)
+    imputed = pc.coalesce(price, fill)
+    tbl = tbl.set_column(idx, 'Price_Per_Unit', imputed)
+
+    count_after_na = imputed.null_count
+    logging.info(
+        '[Transform][transform_table] Imputed %s values using item mapping. %s NaNs remain.',
+        count_before_na - count_after_na, count_after_na
+    )
+
+    return tbl
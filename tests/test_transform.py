@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pandas as pd
+from src.modules.config import setup_pandas
+from src.modules.paths import RAW_FILE_PATH
+from src.transform.transform import transform_data
+
+setup_pandas()
+
+def test_transform_data_does_not_mutate_input():
+    # transform_data must be pure: the caller's frame stays untouched even
+    # though the pipeline no longer takes defensive deep copies.
+    df = pd.read_csv(RAW_FILE_PATH)
+    df_before = df.copy()
+
+    transform_data(df)
+
+    pd.testing.assert_frame_equal(df, df_before)
+
+def test_single_transform_module():
+    # Guard against stale duplicate copies of transform.py drifting apart.
+    src_dir = Path(__file__).resolve().parents[1] / 'src'
+    copies = list(src_dir.rglob('transform.py'))
+    assert len(copies) == 1, f'Expected exactly one transform.py under src/, found: {copies}'
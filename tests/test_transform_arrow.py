@@ -0,0 +1,44 @@
+import pyarrow as pa
+import pytest
+from src.modules.constants import EXPECTED_COLS
+from src.transform.transform_arrow import transform_table
+
+def _raw_table():
+    # Raw header spelling (spaces, mixed case) as it comes out of the CSV.
+    return pa.table({
+        'Transaction ID': ['TXN_1', 'TXN_2', 'TXN_3'],
+        'Customer ID': ['CUST_01', 'CUST_02', 'CUST_03'],
+        'Category': ['Milk Products', 'Milk Products', 'Food'],
+        'Item': ['Item_1_MILK', 'Item_1_MILK', None],
+        'Price Per Unit': [5.0, None, None],
+        'Quantity': [1.0, 2.0, 3.0],
+        'Total Spent': [5.0, 10.0, None],
+        'Payment Method': ['Cash', 'ERROR', 'Cash'],
+        'Location': ['Online', 'Online', 'UNKNOWN'],
+        'Transaction Date': ['2024-01-01', '2024-01-02', 'not-a-date'],
+        'Discount Applied': [True, False, None],
+    })
+
+def test_transform_table_round_trip():
+    out = transform_table(_raw_table())
+
+    # Columns are renamed to the expected schema, in schema order.
+    assert out.column_names == EXPECTED_COLS
+
+    # Invalid markers are nulled regardless of case; real values survive.
+    assert out.column('Payment_Method').null_count == 1
+    assert out.column('Location').null_count == 1
+    assert out.column('Location').to_pylist() == ['Online', 'Online', None]
+
+    # Unparseable dates coerce to null instead of raising.
+    assert out.column('Transaction_Date').null_count == 1
+
+    # The missing price of a known Item is imputed from its first known
+    # price; rows without an Item stay null.
+    assert out.column('Price_Per_Unit').to_pylist() == [5.0, 5.0, None]
+
+def test_transform_table_invalid_schema_raises():
+    tbl = _raw_table().drop_columns('Item')
+
+    with pytest.raises(ValueError, match='Item'):
+        transform_table(tbl)